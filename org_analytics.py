@@ -0,0 +1,110 @@
+import numpy as np
+
+# Posts in the thread since a player's last post before they get flagged for replacement
+INACTIVITY_WARNING_POSTS = 150
+
+def get_phase_bounds(phase_starts: dict, last_post: int, stop_post_num=None):
+    """Return (labels, starts, lengths) for the phases, ordered by start post.
+
+    Phases starting after stop_post_num are left out, since they are past the counted window.
+    """
+    phases = sorted((int(start), f"Day {label}") for label, start in phase_starts.items() if str(start).isdigit())
+    if stop_post_num:
+        phases = [(start, label) for start, label in phases if start <= stop_post_num]
+    if not phases:
+        phases = [(1, "All Posts")]
+
+    starts = np.array([start for start, _ in phases], dtype=np.int64)
+    labels = [label for _, label in phases]
+    ends = np.append(starts[1:] - 1, max(last_post, starts[-1]))
+    return labels, starts, ends - starts + 1
+
+def compute_activity(columns: dict, phase_starts: dict, stop_post_num=None) -> dict:
+    post_numbers = columns["post_number"]
+    player_ids = columns["player_id"]
+    vote_flags = columns["has_vote"]
+    num_players = len(columns["players"])
+
+    last_post = int(post_numbers.max()) if post_numbers.size else 0
+    labels, starts, lengths = get_phase_bounds(phase_starts, last_post, stop_post_num)
+    num_phases = len(labels)
+
+    # The phase being counted is the one the window ends in
+    window_end = min(stop_post_num, last_post) if stop_post_num else last_post
+    current_phase = int(np.searchsorted(starts, window_end, side="right")) - 1
+
+    # Bin every post into its phase; anything before the first phase (signups) is dropped
+    phase_idx = np.searchsorted(starts, post_numbers, side="right") - 1
+    in_game = phase_idx >= 0
+    post_numbers = post_numbers[in_game]
+    player_ids = player_ids[in_game]
+    vote_flags = vote_flags[in_game]
+    phase_idx = phase_idx[in_game]
+
+    cell = phase_idx * num_players + player_ids
+    posts = np.bincount(cell, minlength=num_phases * num_players).reshape(num_phases, num_players)
+    votes = np.bincount(cell, weights=vote_flags, minlength=num_phases * num_players)
+    votes = votes.astype(np.int64).reshape(num_phases, num_players)
+    rates = posts * 100.0 / np.maximum(lengths, 1)[:, None]
+
+    # Gaps between consecutive posts by the same player, measured in thread posts. Every
+    # player starts with a sentinel post just before the game, so the wait for their first
+    # post counts as a gap too
+    game_start = int(starts[0])
+    latest = max(last_post, game_start)
+    all_ids = np.concatenate((np.arange(num_players, dtype=np.int64), player_ids))
+    all_posts = np.concatenate((np.full(num_players, game_start - 1, dtype=np.int64), post_numbers))
+    order = np.lexsort((all_posts, all_ids))
+    sorted_ids = all_ids[order]
+    sorted_posts = all_posts[order]
+    gaps = np.where(sorted_ids[1:] == sorted_ids[:-1], np.diff(sorted_posts), 0)
+    longest_gap = np.zeros(num_players, dtype=np.int64)
+    np.maximum.at(longest_gap, sorted_ids[1:], gaps)
+    last_seen = np.full(num_players, game_start - 1, dtype=np.int64)
+    np.maximum.at(last_seen, player_ids, post_numbers)
+    current_gap = latest - last_seen
+    longest_gap = np.maximum(longest_gap, current_gap)
+
+    return {
+        "phases": labels,
+        "phase_lengths": lengths,
+        "posts": posts,
+        "votes": votes,
+        "rates": rates,
+        "longest_gap": longest_gap,
+        "current_gap": current_gap,
+        "silent_this_phase": posts[current_phase] == 0 if current_phase >= 0 else np.zeros(num_players, dtype=bool),
+    }
+
+def render_activity_tables(columns: dict, valid_players: list, phase_starts: dict, stop_post_num=None) -> str:
+    stats = compute_activity(columns, phase_starts, stop_post_num)
+    players = columns["players"]
+    rows = [players.index(player) for player in valid_players if player in players]
+
+    output_lines = ["[b]Activity[/b]", "[table]"]
+    header = "".join(f"[th]{label}[/th]" for label in stats["phases"])
+    output_lines.append(f"[tr][th]Player[/th]{header}[th]Votes[/th][th]Longest Gap[/th][th]Since Last Post[/th][/tr]")
+
+    for pid in rows:
+        phase_cells = "".join(
+            f"[td]{stats['posts'][phase, pid]} ({stats['rates'][phase, pid]:.1f}%)[/td]"
+            for phase in range(len(stats["phases"]))
+        )
+        output_lines.append(
+            f"[tr][td]{players[pid]}[/td]{phase_cells}[td]{stats['votes'][:, pid].sum()}[/td]"
+            f"[td]{stats['longest_gap'][pid]}[/td][td]{stats['current_gap'][pid]}[/td][/tr]"
+        )
+    output_lines.append("[/table]")
+
+    warnings = []
+    for pid in rows:
+        if stats["current_gap"][pid] >= INACTIVITY_WARNING_POSTS:
+            warnings.append(f"{players[pid]} - no posts in the last {stats['current_gap'][pid]} posts")
+        elif stats["silent_this_phase"][pid]:
+            warnings.append(f"{players[pid]} - no posts this phase")
+
+    if warnings:
+        output_lines.append("[color=red][b]Replacement Warnings[/b][/color]")
+        output_lines.extend(warnings)
+
+    return "\n".join(output_lines)
@@ -3,19 +3,35 @@ from tkinter import scrolledtext, messagebox, filedialog, simpledialog
 from tkinter import *
 import math
 import requests
+from urllib3.util import make_headers
 from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
 import re
 import threading
 from fuzzywuzzy import process
 import difflib
 import os
 import json
+import html
 import customtkinter
+import numpy as np
+from org_analytics import render_activity_tables
 
 CACHE_DIR = 'cache'
 base_url = "https://forums.totalwar.org/vb/"
 CONFIG_FILE = 'config.json'
 player_akas = {}
+phase_starts = {}  # thread key -> {day: first post of that day}
+background_warmup = True
+
+# One keep-alive session for every page fetch, offering every compression urllib3 can decode
+session = requests.Session()
+session.headers.update(make_headers(accept_encoding=True))
+
+# In-memory copies of the thread caches and vote-target resolvers, filled lazily or by the warm-up
+cached_threads = {}
+vote_resolvers = {}
+cache_lock = threading.Lock()
 
 def extract_thread_key(url: str) -> str:
     match = re.search(r'\.php/([^/?#]+)', url)
@@ -26,34 +42,75 @@ def get_cache_path(thread_key: str) -> str:
     return os.path.join(CACHE_DIR, f"{thread_key}.json")
 
 def load_cached_posts(thread_key: str) -> list:
+    if thread_key in cached_threads:
+        return list(cached_threads[thread_key])
     path = get_cache_path(thread_key)
     if os.path.exists(path):
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            cached_threads[thread_key] = json.load(f)
+            return list(cached_threads[thread_key])
     return []
 
 def save_posts_to_cache(thread_key: str, posts: list):
     path = get_cache_path(thread_key)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(posts, f, indent=2)
+    cached_threads[thread_key] = list(posts)
 
-def get_posts_from_page(url):
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+def get_meta_path(thread_key: str) -> str:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, f"{thread_key}.meta.json")
+
+def load_thread_meta(thread_key: str) -> dict:
+    meta = {"total_posts": 0, "total_pages": 0, "last_page_count": 0, "probe": {}, "pages": {}}
+    path = get_meta_path(thread_key)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            meta.update(json.load(f))
+    return meta
+
+def save_thread_meta(thread_key: str, meta: dict):
+    path = get_meta_path(thread_key)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+def fetch_page(url, validators=None):
+    """Conditional GET: returns (html, validators), with html None when the server answers 304."""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = session.get(url, headers=headers)
+    if response.status_code == 304:
+        return None, validators
+
+    return response.text, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+def get_posts_from_page(url, validators=None):
+    html, validators = fetch_page(url, validators)
+    if html is None:
+        return None, validators
+    soup = BeautifulSoup(html, 'html.parser')
     
     posts = []
     
     postlist = soup.find('div', id='postlist', class_='postlist restrain')
     if not postlist:
         print("Could not find post list container")
-        return []
+        return [], validators
     
     individual_posts = get_individual_posts(postlist)
     
     for post in individual_posts:
         posts.append(post)
     
-    return posts
+    return posts, validators
         
 def get_individual_posts(postlist):
     ol = postlist.find('ol', id='posts', class_='posts')
@@ -110,31 +167,190 @@ def get_post_metadata(post):
         'link': full_link
     }
     
+def get_vote_resolver(valid_players, player_akas):
+    """Return the AKA lookup for this player list, built once and reused until the players or AKAs change."""
+    key = (tuple(valid_players), json.dumps(player_akas, sort_keys=True))
+    if key not in vote_resolvers:
+        aka_lookup = {}
+        for player in valid_players:
+            aka_lookup[player.lower()] = player
+            for aka in player_akas.get(player, []):
+                aka_lookup[aka.lower()] = player
+
+        vote_resolvers[key] = {
+            "aka_lookup": aka_lookup,
+            "match_pool": list(aka_lookup.keys()),
+            "resolved": {}
+        }
+    return vote_resolvers[key]
+
+def resolve_vote_target(resolver, voted_raw):
+    """Fuzzy-match a lowercased vote target to a player, remembering each answer."""
+    if voted_raw not in resolver["resolved"]:
+        result = process.extractOne(voted_raw, resolver["match_pool"], score_cutoff=70)
+        if result:
+            matched, score = result
+            resolver["resolved"][voted_raw] = resolver["aka_lookup"].get(matched, matched)
+        else:
+            resolver["resolved"][voted_raw] = None
+    return resolver["resolved"][voted_raw]
+
+# Tokens for the bold-line scanner: comments, CDATA, other declarations and processing
+# instructions, then opening or closing tags (a quoted attribute value may contain ">")
+TAG_PATTERN = re.compile(
+    r'<!--.*?--\s*>|<!\[CDATA\[(.*?)\]\]>|<![^>]*>|<\?[^>]*>'
+    r'|<(/?)([a-zA-Z][^\s/>]*)(?:"[^"]*"|\'[^\']*\'|[^\'">])*?(/?)>',
+    re.DOTALL
+)
+# Character references the way html.parser finds them: they need a terminating character
+# and swallow one trailing semicolon
+ENTITY_PATTERN = re.compile(r'&(?:#([0-9]+|[xX][0-9a-fA-F]+)(?![0-9a-fA-F])|([a-zA-Z][-.a-zA-Z0-9]*)(?![a-zA-Z0-9]))(;?)')
+BOLD_MARKER_PATTERN = re.compile(r'<b[\s/>]', re.IGNORECASE)
+UNVOTE_PATTERN = re.compile(r'^unvote[:\s]*$')
+VOTE_PATTERN = re.compile(r'vote:\s*(.+)', re.IGNORECASE)
+RAW_TEXT_CLOSE_PATTERNS = {
+    'script': re.compile(r'</\s*script\s*>', re.IGNORECASE),
+    'style': re.compile(r'</\s*style\s*>', re.IGNORECASE)
+}
+WHITESPACE_ONLY_PATTERN = re.compile(r'[ \t\n\r\f]*')
+VOID_TAGS = {
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr', 'image', 'img',
+    'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid', 'param', 'source', 'spacer', 'track', 'wbr'
+}
+
+def unescape_text(text, at_end):
+    """Decode character references in a text node the same way BeautifulSoup's html.parser builder does.
+
+    Unlike html.unescape, unknown or unterminated names are left as written, e.g. "&ampy" and
+    a trailing "&lt" at the very end of the post.
+    """
+    if '&' not in text:
+        return text
+
+    def replace(match):
+        number, name, semicolon = match.groups()
+        if at_end and not semicolon and match.end() == len(text):
+            return match.group(0)
+        if number:
+            return html.unescape(f"&#{number};")
+        return EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, f"&{name}")
+
+    return ENTITY_PATTERN.sub(replace, text)
+
+def collapse_whitespace_node(text, open_tags):
+    # BeautifulSoup stores a whitespace-only text node as a single newline or space, except inside <pre>/<textarea>
+    if not WHITESPACE_ONLY_PATTERN.fullmatch(text) or any(name in ('pre', 'textarea') for name, _ in open_tags):
+        return text
+    return '\n' if '\n' in text else ' '
+
+def get_bold_segments(content_html):
+    """Scan post HTML once and return the text of every <b> tag in document order.
+
+    Each tag's text is its text nodes joined by newlines, the same as BeautifulSoup's
+    get_text(separator="\\n"), so <br> and any other tag boundary start a new line.
+    """
+    bold_texts = []  # one list of text nodes per <b>, in the order the tags open
+    open_tags = []  # (tag name, index into bold_texts or None)
+    open_bold = []
+    closed_void_tags = []  # <br> etc. whose stray </br> BeautifulSoup ignores completely
+    pending = []  # pieces of the text node being read
+    position = 0
+
+    def end_text_node():
+        if pending:
+            text = collapse_whitespace_node("".join(pending), open_tags)
+            for index in open_bold:
+                bold_texts[index].append(text)
+            pending.clear()
+
+    while True:
+        token = TAG_PATTERN.search(content_html, position)
+        if not token:
+            break
+        text = content_html[position:token.start()]
+        if text and open_bold:
+            pending.append(unescape_text(text, at_end=False))
+        position = token.end()
+
+        cdata, closing, name, self_closing = token.groups()
+        name = name.lower() if name else None
+        if closing and name in closed_void_tags:
+            closed_void_tags.remove(name)
+            continue  # not even a text node boundary
+
+        end_text_node()
+        if cdata and open_bold:
+            pending.append(cdata)
+            end_text_node()
+        if not name:
+            continue  # comment, CDATA, declaration or processing instruction
+
+        if closing:
+            # Close the most recent matching tag along with anything left open inside it
+            for depth in range(len(open_tags) - 1, -1, -1):
+                if open_tags[depth][0] == name:
+                    del open_tags[depth:]
+                    open_bold = [index for _, index in open_tags if index is not None]
+                    break
+        elif name == 'b':
+            bold_texts.append([])
+            if not self_closing:
+                open_tags.append((name, len(bold_texts) - 1))
+                open_bold.append(len(bold_texts) - 1)
+        elif name in VOID_TAGS:
+            if not self_closing:
+                closed_void_tags.append(name)
+        elif not self_closing:
+            open_tags.append((name, None))
+            if name in RAW_TEXT_CLOSE_PATTERNS:
+                # html.parser reads everything up to the close tag as raw text, which get_text leaves out
+                close = RAW_TEXT_CLOSE_PATTERNS[name].search(content_html, position)
+                position = close.start() if close else len(content_html)
+
+    text = content_html[position:]
+    if text and open_bold:
+        pending.append(unescape_text(text, at_end=True))
+    end_text_node()
+
+    return ["\n".join(texts) for texts in bold_texts]
+
+def has_bold_vote_marker(content_html):
+    # Most posts have no bold vote at all, so skip them before doing any real work
+    # ("&#" could spell "vote" out as character references)
+    lowered = content_html.lower()
+    if 'vote' not in lowered and '&#' not in lowered:
+        return False
+    return BOLD_MARKER_PATTERN.search(lowered) is not None
+
+def has_vote_line(content_html):
+    """Whether the post has a bold vote or unvote line, without resolving the vote target."""
+    if not has_bold_vote_marker(content_html):
+        return False
+
+    for bold_text in get_bold_segments(content_html):
+        for line in bold_text.strip().splitlines():
+            cleaned = line.strip().lower()
+            if UNVOTE_PATTERN.match(cleaned) or VOTE_PATTERN.match(cleaned):
+                return True
+    return False
+
 def extract_vote_from_post_content(content_html, valid_players, player_akas):
-    soup = BeautifulSoup(content_html, "html.parser")
-    bold_tags = soup.find_all("b")
+    if not has_bold_vote_marker(content_html):
+        return None
 
     last_vote = None
-    
-    aka_lookup = {}
-    for player in valid_players:
-        aka_lookup[player.lower()] = player
-        for aka in player_akas.get(player, []):
-            aka_lookup[aka.lower()] = player
-            
-    match_pool = list(aka_lookup.keys())
+    resolver = get_vote_resolver(valid_players, player_akas)
 
-    for b in bold_tags:
-        text = b.get_text(separator="\n").strip()  # Treat <br> as newline
-        lines = text.splitlines()
+    for bold_text in get_bold_segments(content_html):
+        lines = bold_text.strip().splitlines()
 
         for line in lines:
             cleaned = line.strip().lower()
 
-            if re.match(r'^unvote[:\s]*$', cleaned):
+            if UNVOTE_PATTERN.match(cleaned):
                 last_vote = ("UNVOTE", None)
             else:
-                match = re.match(r'vote:\s*(.+)', cleaned, re.IGNORECASE)
+                match = VOTE_PATTERN.match(cleaned)
                 if match:
                     voted_raw = match.group(1).strip().lower()
                     if voted_raw == 'unvote':
@@ -142,10 +358,8 @@ def extract_vote_from_post_content(content_html, valid_players, player_akas):
                     elif voted_raw == 'sleep':
                         last_vote = ("SLEEP", None)
                     else:
-                        result = process.extractOne(voted_raw, match_pool, score_cutoff=70)
-                        if result:
-                            matched, score = result
-                            canonical_name = aka_lookup.get(matched, matched)
+                        canonical_name = resolve_vote_target(resolver, voted_raw)
+                        if canonical_name:
                             last_vote = (canonical_name, None)
                         else:
                             last_vote = (match.group(1).strip(), True)
@@ -153,9 +367,52 @@ def extract_vote_from_post_content(content_html, valid_players, player_akas):
     return last_vote
 
 
-def get_total_posts_and_pages(thread_url):
-    response = requests.get(thread_url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+def get_post_columns(posts, valid_players, stop_post_num=None, vote_results=None):
+    """Flatten cached posts into parallel arrays of post number, interned player id and vote flag.
+
+    Posts already resolved by the vote count are looked up in vote_results; the rest only
+    get the cheap has_vote_line check, since the flag does not need to know who was voted for.
+    """
+    vote_results = vote_results or {}
+    player_index = {player: i for i, player in enumerate(valid_players)}
+    post_numbers = []
+    player_ids = []
+    vote_flags = []
+
+    for post in posts:
+        try:
+            post_number = int(post["thread_post_number"].lstrip('#'))
+        except:
+            continue
+
+        username = post.get("username")
+        if not username or (stop_post_num and post_number > stop_post_num):
+            continue
+
+        content_html = post.get("content_html")
+        if post_number in vote_results:
+            has_vote = vote_results[post_number] is not None
+        else:
+            has_vote = bool(content_html) and has_vote_line(content_html)
+
+        post_numbers.append(post_number)
+        player_ids.append(player_index.setdefault(username, len(player_index)))
+        vote_flags.append(has_vote)
+
+    return {
+        "post_number": np.array(post_numbers, dtype=np.int64),
+        "player_id": np.array(player_ids, dtype=np.int64),
+        "has_vote": np.array(vote_flags, dtype=bool),
+        "players": list(player_index),
+    }
+
+
+def get_total_posts_and_pages(thread_url, validators=None):
+    """Return (total_posts, total_pages, validators); the totals are None when page 1 is unchanged."""
+    html, validators = fetch_page(thread_url, validators)
+    if html is None:
+        return None, None, validators
+    soup = BeautifulSoup(html, 'html.parser')
 
     # This selector may need to be adjusted based on their forum structure
     last_page_span = soup.find('span', class_='first_last')
@@ -168,85 +425,144 @@ def get_total_posts_and_pages(thread_url):
             if match:
                 total_posts = int(match.group(1).replace(',', ''))
                 total_pages = math.ceil(total_posts / 30)
-                return total_posts, total_pages
+                return total_posts, total_pages, validators
 
     # Fallback: count how many post elements are on the first page
     postlist = soup.find('div', id='postlist')
     if postlist:
         posts = get_individual_posts(postlist)
         if posts:
-            return len(posts), 1  # Could be a one-page thread
+            return len(posts), 1, validators  # Could be a one-page thread
 
-    return 0, 0  # Something went wrong
+    return 0, 0, validators  # Something went wrong
 
 def calculate_page_range(start_post_num, stop_post_num, posts_per_page=30):
     start_page = math.ceil(start_post_num / posts_per_page)
     end_page = math.ceil(stop_post_num / posts_per_page) if stop_post_num else None
     return start_page, end_page
 
-def get_current_votes(thread_url, start_post_num, stop_post_num, valid_players, text_output, day):
+def update_thread_cache(thread_url, start_post_num, stop_post_num, text_output=None):
+    """Fetch any pages newer than the thread cache and return (all_posts, last_cached_post)."""
     posts_per_page = 30
     start_page, end_page = calculate_page_range(start_post_num, stop_post_num, posts_per_page)
 
-    if end_page is None:
-        _, total_pages = get_total_posts_and_pages(thread_url)
-        end_page = total_pages
+    # Only one of the warm-up and a vote count may touch the cache files at a time
+    with cache_lock:
+        # === Load and prepare cache ===
+        thread_key = extract_thread_key(thread_url)
+        cached_posts = load_cached_posts(thread_key)
+        thread_meta = load_thread_meta(thread_key)
+        if not cached_posts:
+            # Page validators are only good while the posts they cover are still in the cache
+            thread_meta["pages"] = {}
+            thread_meta["probe"] = {}
 
-    latest_votes = {}  # voter -> (votee, metadata)
-    post_counts = {}
-    invalid_votes = []
-    
-    # === Load and prepare cache ===
-    thread_key = extract_thread_key(thread_url)
-    cached_posts = load_cached_posts(thread_key)
-    cached_post_nums = set(int(p["thread_post_number"].lstrip('#')) for p in cached_posts if "thread_post_number" in p)
-    all_posts = cached_posts.copy()
-    last_cached_post = max(cached_post_nums) if cached_post_nums else 0
-    first_needed_post = max(start_post_num, last_cached_post + 1)
+        cached_post_nums = set(int(p["thread_post_number"].lstrip('#')) for p in cached_posts if "thread_post_number" in p)
+        all_posts = cached_posts.copy()
+        last_cached_post = max(cached_post_nums) if cached_post_nums else 0
+        first_needed_post = max(start_post_num, last_cached_post + 1)
     
-    start_page = math.ceil(first_needed_post / 30)
+        start_page = math.ceil(first_needed_post / 30)
+
+        follow_new_pages = False
+        if end_page is None:
+            if 0 < thread_meta["last_page_count"] < posts_per_page and start_page <= thread_meta["total_pages"]:
+                # The last page still had room, so new posts are on it or on the pages right after it
+                end_page = thread_meta["total_pages"]
+                follow_new_pages = True
+            else:
+                # Page 1 shows the post total, so it only comes back unchanged when nothing was posted
+                total_posts, total_pages, thread_meta["probe"] = get_total_posts_and_pages(thread_url, thread_meta["probe"])
+                if total_pages is None:
+                    end_page = thread_meta["total_pages"]
+                else:
+                    end_page = total_pages
+                    thread_meta["total_posts"] = total_posts
+                    thread_meta["total_pages"] = total_pages
     
-    for page_num in range(start_page, end_page + 1):
-        page_url = f"{thread_url}/page{page_num}"
-
-        text_output.insert(tk.END, f"Processing page {page_num}...\n")
-        text_output.see(tk.END)
-        text_output.update()
-
-        posts = get_posts_from_page(page_url)
-
-        for post in posts:
-            metadata = get_post_metadata(post)
-            if not metadata:
+        page_num = start_page
+        while page_num <= end_page:
+            page_url = f"{thread_url}/page{page_num}"
+
+            if text_output:
+                text_output.insert(tk.END, f"Processing page {page_num}...\n")
+                text_output.see(tk.END)
+                text_output.update()
+
+            posts, validators = get_posts_from_page(page_url, thread_meta["pages"].get(str(page_num)))
+            if posts is None:
+                # Not modified since we last fetched it, so its posts are already cached
+                page_num += 1
                 continue
 
-            post_number_str = metadata['thread_post_number'].lstrip('#')
-            if not post_number_str.isdigit():
-                continue
-            post_number = int(post_number_str)
+            new_posts = 0
+            page_fully_cached = True
+            for post in posts:
+                metadata = get_post_metadata(post)
+                if not metadata:
+                    continue
+
+                post_number_str = metadata['thread_post_number'].lstrip('#')
+                if not post_number_str.isdigit():
+                    continue
+                post_number = int(post_number_str)
+
+                # Skip if this post is already in the cache
+                if post_number in cached_post_nums:
+                    continue
+
+                if post_number < start_post_num or (stop_post_num and post_number > stop_post_num):
+                    page_fully_cached = False
+                    continue
+
+                # Save this new post to the working set
+                post_data = {
+                    "thread_post_number": metadata['thread_post_number'],
+                    "username": get_username_from_post(post),
+                    "content_html": get_content_from_post(post),
+                    "link": metadata['link']
+                }
+                all_posts.append(post_data)
+                cached_post_nums.add(post_number)
+                new_posts += 1
+
+            # Past the last page the forum serves the last page again, which brings nothing new
+            if page_num > thread_meta["total_pages"] and not new_posts:
+                break
+
+            if page_fully_cached and any(validators.values()):
+                thread_meta["pages"][str(page_num)] = validators
+            if page_num >= thread_meta["total_pages"]:
+                thread_meta["total_pages"] = page_num
+                thread_meta["last_page_count"] = len(posts)
+
+            if follow_new_pages and page_num == end_page and len(posts) >= posts_per_page:
+                end_page += 1
+            page_num += 1
+            
+        # === Save back to cache ===
+        if thread_key:
+            save_posts_to_cache(thread_key, all_posts)
+            cached_posts = load_cached_posts(thread_key)
+            cached_post_nums = set(int(p["thread_post_number"].lstrip('#')) for p in cached_posts if "thread_post_number" in p)
+            last_cached_post = max(cached_post_nums) if cached_post_nums else 0
+            thread_meta["total_posts"] = max(thread_meta["total_posts"], last_cached_post)
+            save_thread_meta(thread_key, thread_meta)
+
+    return all_posts, last_cached_post
+
+def warm_up(thread_url, start_post_num, stop_post_num, valid_players):
+    """Load the thread cache, build the vote resolver and fetch new pages ahead of the first count."""
+    get_vote_resolver(valid_players, player_akas)
+    update_thread_cache(thread_url, start_post_num, stop_post_num)
 
-            if post_number < start_post_num or (stop_post_num and post_number > stop_post_num):
-                continue
+def get_current_votes(thread_url, start_post_num, stop_post_num, valid_players, text_output, day):
+    latest_votes = {}  # voter -> (votee, metadata)
+    invalid_votes = []
+    vote_results = {}  # post number -> vote found in it, reused for the activity columns
 
-            # Skip if this post is already in the cache
-            if post_number in cached_post_nums:
-                continue
+    all_posts, last_cached_post = update_thread_cache(thread_url, start_post_num, stop_post_num, text_output)
 
-            # Save this new post to the working set
-            post_data = {
-                "thread_post_number": metadata['thread_post_number'],
-                "username": get_username_from_post(post),
-                "content_html": get_content_from_post(post),
-                "link": metadata['link']
-            }
-            all_posts.append(post_data)
-            
-    # === Save back to cache ===
-    if thread_key:
-        save_posts_to_cache(thread_key, all_posts)
-        cached_posts = load_cached_posts(thread_key)
-        cached_post_nums = set(int(p["thread_post_number"].lstrip('#')) for p in cached_posts if "thread_post_number" in p)
-        last_cached_post = max(cached_post_nums) if cached_post_nums else 0
     # === Process all posts now ===
     for post in all_posts:
         try:
@@ -258,8 +574,6 @@ def get_current_votes(thread_url, start_post_num, stop_post_num, valid_players,
             continue
 
         username = post["username"]
-        if username:
-            post_counts[username] = post_counts.get(username, 0) + 1
         if not username or username not in valid_players:
             continue
 
@@ -268,6 +582,7 @@ def get_current_votes(thread_url, start_post_num, stop_post_num, valid_players,
             continue
 
         vote_result = extract_vote_from_post_content(content_html, valid_players, player_akas)
+        vote_results[post_number] = vote_result
         if vote_result:
             vote, is_invalid = vote_result
 
@@ -290,6 +605,13 @@ def get_current_votes(thread_url, start_post_num, stop_post_num, valid_players,
             elif username not in latest_votes:
                 invalid_votes.append((username, vote, post["link"]))
 
+    columns = get_post_columns(all_posts, valid_players, stop_post_num, vote_results)
+    in_window = columns["post_number"] >= start_post_num
+    if stop_post_num:
+        in_window &= columns["post_number"] <= stop_post_num
+    window_counts = np.bincount(columns["player_id"][in_window], minlength=len(columns["players"]))
+    post_counts = {name: int(count) for name, count in zip(columns["players"], window_counts) if count}
+
     sorted_votes = sorted(latest_votes.items(), key=lambda item: item[1][1]["thread_post_number"])
 
     votee_map = {}
@@ -322,6 +644,9 @@ def get_current_votes(thread_url, start_post_num, stop_post_num, valid_players,
         output_lines.append("[/td][/tr]")
 
     output_lines.append("[/table]")
+
+    output_lines.append("")
+    output_lines.append(render_activity_tables(columns, valid_players, phase_starts.get(extract_thread_key(thread_url), {}), stop_post_num))
     return "\n".join(output_lines)
 
 # Build GUI
@@ -336,11 +661,13 @@ def run_gui():
                 if not url:
                     messagebox.showerror("Error", "Please enter the Game Thread URL.")
                     return
-                players = [player_listbox.get(i).strip() for i in range(player_listbox.size()) if player_listbox.get(i).strip()]
+                players = get_player_list()
                 if not players:
                     messagebox.showerror("Error", "Please enter valid player names.")
                     return
                 day = day_entry.get()
+                if day and start_entry.get():
+                    phase_starts.setdefault(extract_thread_key(url), {})[day] = start
 
                 # Optional: disable button while loading
                 get_votes_button.configure(state="disabled")
@@ -689,7 +1016,8 @@ def run_gui():
     result_text.place(x=0, y=200)
 
     def get_player_list():
-        return list(player_listbox.get(0, tk.END))
+        """Player names as the vote count sees them, so the warm-up builds the same resolver."""
+        return [player.strip() for player in player_listbox.get(0, tk.END) if player.strip()]
 
     def select_all(event):
         player_listbox.select_set(0, tk.END)
@@ -707,7 +1035,9 @@ def run_gui():
             "last_post": end_entry.get().strip(),
             "dayphase": day_entry.get().strip(),
             "player_list": [player_listbox.get(i) for i in range(player_listbox.size())],
-            "player_akas": player_akas
+            "player_akas": player_akas,
+            "phase_starts": phase_starts,
+            "background_warmup": background_warmup
         }
         
         try:
@@ -718,7 +1048,7 @@ def run_gui():
 
     def load_config():
         """Load settings from the JSON configuration file."""
-        global player_akas
+        global player_akas, phase_starts, background_warmup
         if os.path.exists(CONFIG_FILE):
             try:
                 with open(CONFIG_FILE, "r", encoding="utf-8") as f:
@@ -734,10 +1064,36 @@ def run_gui():
                 for player in config.get("player_list", []):
                     player_listbox.insert(tk.END, player)
                 player_akas = config.get("player_akas", {})
+                # Older configs kept one flat {day: start} dict for every game; those can't be tied to a thread
+                phase_starts = {key: days for key, days in config.get("phase_starts", {}).items() if isinstance(days, dict)}
+                background_warmup = config.get("background_warmup", True)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load configuration: {e}")
     
+    def start_warm_up():
+        """Get the saved game's cache and new pages ready in the background so the first count is quick."""
+        url = url_entry.get().strip()
+        players = get_player_list()
+        if not background_warmup or not url or not players:
+            return
+        try:
+            start = int(start_entry.get()) if start_entry.get() else 1
+            stop = int(end_entry.get()) if end_entry.get() else None
+        except ValueError:
+            return
+
+        def task():
+            try:
+                warm_up(url, start, stop, players)
+            except Exception as e:
+                # Nothing is lost: the first count fetches whatever the warm-up could not
+                message = f"Background warm-up failed: {e}\n"
+                root.after(0, lambda: result_text.insert(tk.END, message))
+
+        threading.Thread(target=task, daemon=True).start()
+
     load_config()
+    start_warm_up()
 
     root.mainloop()
 
@@ -0,0 +1,98 @@
+"""Activity statistics built from the columnar post corpus."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import org_analytics
+import org_vc
+
+PLAYERS = ["Alice", "Bob", "Carl"]
+
+
+def make_posts(entries):
+    return [
+        {
+            "thread_post_number": f"#{number}",
+            "username": username,
+            "content_html": content,
+            "link": f"https://example.invalid/post{number}",
+        }
+        for number, username, content in entries
+    ]
+
+
+def columns_for(entries, stop_post_num=None):
+    return org_vc.get_post_columns(make_posts(entries), PLAYERS, stop_post_num)
+
+
+def test_post_columns_intern_valid_players_first():
+    columns = columns_for([
+        (1, "Host", "Signups are open"),
+        (2, "Bob", "<b>vote: alice</b>"),
+        (3, "Alice", "hello"),
+    ])
+
+    assert columns["players"] == ["Alice", "Bob", "Carl", "Host"]
+    assert columns["post_number"].tolist() == [1, 2, 3]
+    assert columns["player_id"].tolist() == [3, 1, 0]
+    assert columns["has_vote"].tolist() == [False, True, False]
+
+
+def test_posts_and_votes_are_binned_by_phase_and_signups_dropped():
+    columns = columns_for([
+        (2, "Alice", "signing up"),
+        (5, "Alice", "<b>vote: bob</b>"),
+        (6, "Bob", "hi"),
+        (10, "Alice", "day two"),
+        (11, "Carl", "<b>vote: alice</b>"),
+    ])
+    stats = org_analytics.compute_activity(columns, {"1": 5, "2": 10})
+
+    assert stats["phases"] == ["Day 1", "Day 2"]
+    assert stats["phase_lengths"].tolist() == [5, 2]
+    assert stats["posts"][:, :3].tolist() == [[1, 1, 0], [1, 0, 1]]
+    assert stats["votes"][:, :3].tolist() == [[1, 0, 0], [0, 0, 1]]
+
+
+def test_recounting_an_earlier_day_checks_that_day_for_silence():
+    entries = [(5, "Alice", "x"), (6, "Bob", "x"), (7, "Carl", "x"), (300, "Alice", "x")]
+    columns = columns_for(entries, stop_post_num=299)
+    stats = org_analytics.compute_activity(columns, {"1": 5, "2": 300}, stop_post_num=299)
+
+    assert stats["phases"] == ["Day 1"]
+    assert not stats["silent_this_phase"][:3].any()
+
+
+def test_new_day_silence_is_checked_against_the_day_containing_the_latest_post():
+    columns = columns_for([(5, "Alice", "x"), (6, "Bob", "x"), (10, "Carl", "x")])
+    stats = org_analytics.compute_activity(columns, {"1": 5, "2": 10})
+
+    assert stats["silent_this_phase"][:3].tolist() == [True, True, False]
+
+
+def test_longest_gap_counts_the_wait_before_a_first_post():
+    columns = columns_for([(1, "Alice", "x"), (400, "Bob", "x"), (401, "Alice", "x")])
+    stats = org_analytics.compute_activity(columns, {})
+
+    assert stats["longest_gap"][:3].tolist() == [400, 400, 401]
+    assert stats["current_gap"][:3].tolist() == [0, 1, 401]
+
+
+def test_empty_corpus():
+    columns = columns_for([])
+    stats = org_analytics.compute_activity(columns, {"1": 1})
+
+    assert stats["posts"].tolist() == [[0, 0, 0]]
+    assert not stats["silent_this_phase"].any()
+
+    output = org_analytics.render_activity_tables(columns, PLAYERS, {"1": 1})
+    assert "[tr][td]Carl[/td][td]0 (0.0%)[/td]" in output
+
+
+def test_no_phases_renders_a_single_all_posts_column():
+    columns = columns_for([(1, "Alice", "x"), (2, "Bob", "x")])
+    output = org_analytics.render_activity_tables(columns, PLAYERS, {})
+
+    assert "[th]All Posts[/th]" in output
+    assert "[tr][td]Alice[/td][td]1 (50.0%)[/td]" in output
+    assert "Carl - no posts this phase" in output
@@ -0,0 +1,147 @@
+"""Differential tests: the bold-line scanner against the BeautifulSoup logic it replaced."""
+import os
+import random
+import re
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import org_vc
+
+PLAYERS = ["Alice", "Bob the Great", "Carl", "dave99"]
+AKAS = {"Bob the Great": ["btg"]}
+
+FRAGMENTS = [
+    "",
+    "plain text with no bold at all",
+    "I think we should vote for someone soon",
+    "<b>vote: alice</b>",
+    "<B>Vote: btg</B>",
+    "<b>VOTE:carl</b>",
+    "<b>unvote</b>",
+    "<b>Unvote:</b>",
+    "<b>vote: unvote</b>",
+    "<b>vote: sleep</b>",
+    "<b>vote: nobody in particular</b>",
+    "<b>vote: alice<br>unvote</b>",
+    "<b>vote: alice<br />vote: carl</b>",
+    "<b>vote: <i>carl</i></b>",
+    "<b>vote: alice</b> some words <b>vote: carl</b>",
+    "<b>vote: alice <b>vote: carl</b> tail</b>",
+    "<b>vote: alice",
+    "<div><b>vote: carl</div> more vote: alice",
+    "<b><a title=\"a>b\">vote: carl</a></b>",
+    "<b><span title='x>vote: alice'>vote: carl</span></b>",
+    "<b>a<![CDATA[vote: carl]]>b</b>",
+    "<b>vote: <!-- alice --> carl</b>",
+    "<b>a<!-- x --!>b<!--->vote: alice</b>",
+    "<b>x <?php echo 1 ?> y <!DOCTYPE html> vote: carl</b>",
+    "<b>vote: a &amp b</b>",
+    "<b>vote: al&amp</b>",
+    "<b>vote: &ampy &ampx;y &notit; &AMP; &Amp;</b>",
+    "<b>vote: &#65;lice &#65 &#x41g &#65a;z &#150; &#0;</b>",
+    "<b>v&#111;te: carl</b>",
+    "<b>vote: &lt;b&gt;alice</b>",
+    "<b>vote: alice &lt",
+    "<b/>vote: alice",
+    "<b>a</br>vote: carl</b>",
+    "<b>vote: ali<br>ce</br>carl</b>",
+    "<b>vote: alice<b>   </b>\n\n<pre>  </pre></b>",
+    "<b class=\"x\">vote:\n  dave</b>",
+    "<blockquote><b>vote: btg</b></blockquote><body>vote</body>",
+    "<b>  vote: carl  </b><img src=\"a.png\"><b>unvote</b>",
+    "<b>vote: alice</B> <b>vote: dave99</b >",
+    "<b><style>vote: a</style>vote: carl</b>",
+    "<b><script>x<b>vote: carl</b></script></b>",
+    "<b><SCRIPT>x</script >vote: alice</b>",
+    "<b><script>a</scriptx>vote: alice</script>vote: carl</b>",
+    "<b>vote: alice<script>vote: carl",
+    "<b>vote: a<script></script>lice</b>",
+    "<b><script/>vote: carl</b>",
+    "<b><style title=\">\">vote: alice</style>vote: carl</b>",
+]
+
+PIECES = [
+    "<b>", "</b>", "<B>", "</B>", "<b class='v'>", "<br>", "<br />", "</br>", "<i>", "</i>",
+    "<div>", "</div>", "<span title=\"a>b\">", "</span>", "<a href='x>y'>", "</a>", "<u>", "</u>",
+    "<img src=\"a.png\">", "<blockquote>", "</blockquote>", "<b/>", "<hr>", "</hr>", "<pre>", "</pre>",
+    "vote: alice", "Vote: btg", "VOTE: carl", " vote:dave", "unvote", "Unvote:", "vote: unvote",
+    "vote: sleep", "vote: zzzqqq", "vote", "vote:  ", "hello world", "\n", "  ", "text<3 ok",
+    "&amp;", "&amp ", "&ampy", "&lt;b&gt;vote: bob", "&#65;", "&#x42; ", "&copy;", "&nosuch; ",
+    "<!-- <b>vote: carl</b> -->", "<![CDATA[vote: alice]]>", "<?php x ?>",
+    "<script>", "</script>", "<style>", "</style>", "<script/>", "</STYLE >",
+]
+
+
+def generated_fragments(count=3000, seed=20240601):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(PIECES) for _ in range(rng.randint(1, 20))) for _ in range(count)]
+
+
+CORPUS = FRAGMENTS + generated_fragments()
+
+
+def reference_bold_segments(content_html):
+    soup = BeautifulSoup(content_html, "html.parser")
+    return [b.get_text(separator="\n") for b in soup.find_all("b")]
+
+
+def reference_extract_vote(content_html, valid_players, player_akas):
+    """extract_vote_from_post_content as it was before the scanner."""
+    soup = BeautifulSoup(content_html, "html.parser")
+    bold_tags = soup.find_all("b")
+
+    last_vote = None
+    resolver = org_vc.get_vote_resolver(valid_players, player_akas)
+
+    for b in bold_tags:
+        text = b.get_text(separator="\n").strip()
+        lines = text.splitlines()
+
+        for line in lines:
+            cleaned = line.strip().lower()
+
+            if re.match(r'^unvote[:\s]*$', cleaned):
+                last_vote = ("UNVOTE", None)
+            else:
+                match = re.match(r'vote:\s*(.+)', cleaned, re.IGNORECASE)
+                if match:
+                    voted_raw = match.group(1).strip().lower()
+                    if voted_raw == 'unvote':
+                        last_vote = ("UNVOTE", None)
+                    elif voted_raw == 'sleep':
+                        last_vote = ("SLEEP", None)
+                    else:
+                        canonical_name = org_vc.resolve_vote_target(resolver, voted_raw)
+                        if canonical_name:
+                            last_vote = (canonical_name, None)
+                        else:
+                            last_vote = (match.group(1).strip(), True)
+
+    return last_vote
+
+
+@pytest.mark.parametrize("content_html", FRAGMENTS)
+def test_bold_segments_match_beautifulsoup(content_html):
+    assert org_vc.get_bold_segments(content_html) == reference_bold_segments(content_html)
+
+
+def test_bold_segments_match_beautifulsoup_on_generated_corpus():
+    mismatches = [c for c in CORPUS if org_vc.get_bold_segments(c) != reference_bold_segments(c)]
+    assert mismatches == []
+
+
+def test_extract_vote_matches_beautifulsoup_logic():
+    mismatches = [
+        c for c in CORPUS
+        if org_vc.extract_vote_from_post_content(c, PLAYERS, AKAS) != reference_extract_vote(c, PLAYERS, AKAS)
+    ]
+    assert mismatches == []
+
+
+def test_has_vote_line_agrees_with_extract_vote():
+    for content_html in CORPUS:
+        expected = org_vc.extract_vote_from_post_content(content_html, PLAYERS, AKAS) is not None
+        assert org_vc.has_vote_line(content_html) == expected